@@ -6,6 +6,14 @@ from rake import Rake
 from playwright._impl._errors import TargetClosedError
 from colorama import Fore
 
+try:
+    # libuv-backed event loop, a solid win for the socket-heavy
+    # browser traffic; unavailable on Windows
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 
 @click.group(invoke_without_command=True)
 @click.argument('config_file', required=False, type=click.Path(exists=True))
@@ -36,7 +44,8 @@ async def rakestart(config_file: str):
     finally:
         try:
             await rake.end()
-            rake.data(output=True)
+            await Rake.shutdown()
+            await rake.output()
         except ValueError as e:
             print(e)
 
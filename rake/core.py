@@ -1,12 +1,22 @@
 
 import asyncio
+from collections import ChainMap, namedtuple
 from types import ModuleType
-import re, json, os, importlib, time, shutil, random, string, yaml
+import copy, json, operator, os, importlib, time, shutil, random, string, yaml
 from typing import Dict, Any, List, Literal, Tuple, Callable
+
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from colorama import Fore, Style
-from slugify import slugify
-from tabulate import tabulate
-import pandas as pd
+from itertools import zip_longest
 from playwright.async_api import async_playwright, Browser, BrowserContext, BrowserType, Page, Locator, Route
 from rake.utils.helpers import pick, is_none_keys, is_numeric, get_file_type, get_total_size, format_seconds, format_size
 from rake.utils import notation, keypath, helpers as util
@@ -30,25 +40,150 @@ Link = Dict[Literal['url', 'metadata'], str | Dict[str, Any]]
 
 Links = Dict[str, List[Link]]
 
-State = Dict[Literal['data', 'vars', 'links'], Dict[str, Any]]
+State = Dict[Literal['data', 'vars', 'links', 'seen', 'size'], Dict[str, Any] | int]
 
 Attribute = str | Dict[Literal['attribute', 'child_node', 'context', 'all', 'element', 'utils', 'var'], str | bool | List[str]]
 
 DOMRect = Dict[Literal['x', 'y', 'width', 'height', 'top', 'right', 'bottom', 'left'], float]
 
 
+NodePlan = namedtuple('NodePlan', ['element', 'name', 'loc_kwargs', 'wait', 'all', 'range', 'show', 'actions', 'links', 'data', 'interact'])
+
+
+def _compile_node(node: NodeConfig, plans: Dict[int, Tuple[NodeConfig, NodePlan]]) -> NodePlan:
+    """
+    Precompile a node config into a plan so the per-locator hot loop
+    reads attributes instead of re-doing dict lookups and name
+    sanitizing on every visit. Plans are cached by config identity in
+    the given per-instance dict; each entry also holds the node dict
+    itself so its id cannot be recycled by another dict while the
+    plan is cached.
+    """
+    entry = plans.get(id(node))
+
+    if entry is None:
+        loc_kwargs = {}
+
+        if 'contains' in node: loc_kwargs['has_text'] = node['contains']
+
+        if 'excludes' in node: loc_kwargs['has_not_text'] = node['excludes']
+
+        plan = NodePlan(
+            element=node['element'],
+            name=node.get('name', node['element']).replace(':', '-'),
+            loc_kwargs=loc_kwargs,
+            wait=node.get('wait'),
+            all=node.get('all', False),
+            range=node.get('range', []),
+            show=node.get('show', False),
+            actions=node.get('actions', []),
+            links=node.get('links'),
+            data=node.get('data'),
+            interact=node.get('interact')
+        )
+        plans[id(node)] = (node, plan)
+
+        return plan
+
+    return entry[1]
+
+
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict] = {}
+
+_CONFIG_CACHE_MAX = 64
+
+# Playwright drivers and browsers are reused across Rake runs, keyed by
+# event loop (driver objects are loop-bound) and launch options; a fresh
+# BrowserContext per run is roughly two orders of magnitude cheaper than
+# a browser launch. Entries hold the loop itself so its id cannot be
+# recycled by a later loop while the pool still references it.
+_PLAYWRIGHTS: Dict[int, Tuple[Any, Any]] = {}
+
+_BROWSERS: Dict[Tuple, Browser] = {}
+
+_BROWSER_LOCKS: Dict[int, Tuple[Any, asyncio.Lock]] = {}
+
+
+_RESOURCE_GLOBS: Dict[str, str] = {
+    'image': '**/*.{png,jpg,jpeg,gif,webp,svg,ico}',
+    'font': '**/*.{woff,woff2,ttf,otf,eot}',
+    'stylesheet': '**/*.css',
+    'media': '**/*.{mp4,webm,mp3,ogg,wav}',
+}
+
+
+def _slug_util(value: Any, args: List[str]) -> str:
+    # deferred so configs that never slugify skip the import
+    from slugify import slugify
+
+    return slugify(str(value))
+
+
+def _subtract_util(value: Any, args: List[str]) -> float:
+    if is_numeric(value): value = float(value)
+    else: value = 0.0
+
+    if len(args) > 0 and is_numeric(args[0]):
+        value = float(value) - float(args[0])
+
+    return value
+
+
+# repeat-while conditions keep looping only while the comparison holds
+_CMP: Dict[str, Callable] = {
+    'equal': operator.eq,
+    'is': operator.eq,
+    'not_equal': operator.ne,
+    'not': operator.ne,
+    'greater_than': operator.gt,
+    'less_than': operator.lt,
+    'greater_than_or_equal': operator.ge,
+    'less_than_or_equal': operator.le,
+}
+
+
+_UTILS: Dict[str, Callable] = {
+    'prepend': lambda value, args: f'{args[0]}{value or ''}' if len(args) > 0 else value,
+    'lowercase': lambda value, args: str(value).lower(),
+    'slug': _slug_util,
+    'subtract': _subtract_util,
+    'clear_url_params': lambda value, args: value.split('?')[0],
+    'trim': lambda value, args: value.strip(),
+    'nullify': lambda value, args: value or None,
+}
+
+
 class Rake:
     DEFAULT_LOGGING = False
 
+    # attribute access shows up in the crawl hot loops,
+    # slots make it an offset read instead of a dict lookup
+    __slots__ = (
+        '_Rake__browser_context',
+        '_Rake__browser',
+        '_Rake__page_pool',
+        '_Rake__config',
+        '_Rake__state',
+        '_Rake__start_time',
+        '_Rake__total_opened_pages',
+        '_Rake__id',
+        '_Rake__portal',
+        '_Rake__log',
+        '_Rake__node_plans',
+    )
+
     def __init__(self, config: Dict[str, Any] = {}):
         self.__browser_context: BrowserContext = None
         self.__browser: Browser = None
+        self.__page_pool: asyncio.Queue | None = None
         self.__config = config
-        self.__state: State = {'data': {}, 'vars': {}, 'links': {}}
+        self.__state: State = {'data': {}, 'vars': {}, 'links': {}, 'seen': {}, 'size': 0}
         self.__start_time = 0
         self.__total_opened_pages = 0
         self.__id = ''.join(random.choices(string.ascii_letters + '_', k=6))
         self.__portal: ModuleType | None = None
+        self.__log = config.get('logging', Rake.DEFAULT_LOGGING)
+        self.__node_plans: Dict[int, Tuple[NodeConfig, NodePlan]] = {}
 
 
     async def start(self) -> Dict:
@@ -58,7 +193,7 @@ class Rake:
         except Exception as e:
             raise e
         finally:
-            if self.__config.get('logging', Rake.DEFAULT_LOGGING):
+            if self.__log:
                 print()
                 self.table()
                 print()
@@ -89,6 +224,12 @@ class Rake:
         return self.__state['data']
 
 
+    async def output(self, filepath: str | List[str] = []) -> Dict:
+        # file writes are blocking, run them off the event loop so
+        # anything still scheduled keeps moving
+        return await asyncio.to_thread(self.data, filepath, True)
+
+
     def links(self, filepath: str | None = None) -> Dict:
         if not filepath: 
             self.__output(filepath, get_file_type(filepath), state='links')
@@ -97,8 +238,13 @@ class Rake:
 
 
     def table(self) -> None:
+        from tabulate import tabulate
+
         duration = format_seconds(int(time.time() - self.__start_time))
-        data_size = format_size(get_total_size(self.__state['data']))
+
+        # maintained incrementally as values are extracted,
+        # no end-of-run walk over the whole data tree
+        data_size = format_size(self.__state['size'])
         mode = 'headless' if not self.__config.get('browser', {}).get('show', False) else 'visible'
         output = ', '.join([output['type'].upper() for output in self.__get_outputs()] or ['dict'])
 
@@ -132,13 +278,30 @@ class Rake:
 
     @staticmethod
     def load_config(filename: str) -> Dict:
+        stat = os.stat(filename)
+        key = (os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+
+        if key in _CONFIG_CACHE:
+            # deep copy keeps cached entries isolated from caller mutation
+            return copy.deepcopy(_CONFIG_CACHE[key])
+
+        filetype = get_file_type(filename)
+
+        if filetype not in ['yaml', 'json']:
+            raise ValueError(Fore.RED + 'Unable to load unsupported config file type, ' + Fore.BLUE + filename + Fore.RESET)
+
         with open(filename, 'r') as file:
-            if get_file_type(filename) == 'yaml':
-                return yaml.safe_load(file)
-            elif get_file_type(filename) == 'json':
-                return json.load(file)
-                
-        raise ValueError(Fore.RED + 'Unable to load unsupported config file type, ' + Fore.BLUE + filename + Fore.RESET)
+            if filetype == 'yaml':
+                config = yaml.load(file, Loader=YamlLoader)
+            else:
+                config = orjson.loads(file.read()) if orjson else json.load(file)
+
+        if len(_CONFIG_CACHE) >= _CONFIG_CACHE_MAX:
+            _CONFIG_CACHE.pop(next(iter(_CONFIG_CACHE)))
+
+        _CONFIG_CACHE[key] = copy.deepcopy(config)
+
+        return config
 
 
     async def __start(self) -> None:
@@ -148,31 +311,46 @@ class Rake:
         if 'rake' not in self.__config: return self.data()
 
         self.__start_time = time.time()
+        race = self.__config.get('race', self.__config.get('browser', {}).get('concurrency', 1))
+
+        # warm the pool so workers start with ready pages
+        # instead of serializing page creation on first use
+        for page in await asyncio.gather(*[self.__browser_context.new_page() for _ in range(race)]):
+            self.__page_pool.put_nowait(page)
+
+        # one worker pool multiplexes every page config, so independent
+        # templates overlap instead of running in separate phases; the
+        # queue is unbounded because workers feed discovered links back
+        # into it, and a full queue would deadlock that self-put
+        queue = asyncio.Queue()
+        tasks = [asyncio.create_task(self.__concurrent(queue)) for i in range(race)]
 
         for page_config in self.__config['rake']:
-            links = self.__resolve_page_link(page_config['link'])
-            race = self.__config.get('race', 1)
-            queue = asyncio.Queue(maxsize=race)
-            tasks = [asyncio.create_task(self.__concurrent(queue, page_config)) for i in range(race)]
+            if self.__has_link_refs(page_config['link']):
+                # $name references need the earlier templates to finish
+                # collecting links before they can be resolved
+                await queue.join()
 
-            for link in links:
-                await queue.put(link)
+            for link in self.__resolve_page_link(page_config['link']):
+                await queue.put((link, page_config))
 
-            await queue.join()
+        await queue.join()
 
-            for _ in tasks:
-                await queue.put(None)
+        for _ in tasks:
+            await queue.put(None)
 
-            for ret in await asyncio.gather(*tasks, return_exceptions=True):
-                if not isinstance(ret, Exception): continue
-                raise ret
+        for ret in await asyncio.gather(*tasks, return_exceptions=True):
+            if not isinstance(ret, Exception): continue
+            raise ret
 
 
-    async def __concurrent(self, queue: asyncio.Queue, config: PageConfig) -> None:
+    async def __concurrent(self, queue: asyncio.Queue) -> None:
         while True:
-            link: Link = await queue.get()
+            item: Tuple[Link, PageConfig] | None = await queue.get()
+
+            if item is None: break
 
-            if link is None: break
+            link, config = item
 
             page_manager = self.__PageManager(
                 link,
@@ -181,6 +359,8 @@ class Rake:
                 self.__state,
                 self.__browser_context,
                 queue,
+                self.__page_pool,
+                self.__node_plans,
                 self.__portal
             )
             
@@ -195,37 +375,118 @@ class Rake:
     
 
     async def __launch_browser(self):
-        playwright = await async_playwright().start()
         browser_config: Dict[str, Any] = self.__config.get('browser', {})
         browser_name: str = browser_config.get('type', 'chromium')
-
-        if not hasattr(playwright, browser_name):
-            raise ValueError(Fore.RED + 'Unsupported or invalid browser type, ' + Fore.CYAN + browser_name + Fore.RESET)
-        
         kwargs = {}
 
         if 'show' in browser_config:
             kwargs['headless'] = not browser_config['show']
-        
+
         if 'slowdown' in browser_config:
             kwargs['slow_mo'] = browser_config['slowdown']
 
-        browser_type: BrowserType = getattr(playwright, browser_name)
+        loop = asyncio.get_running_loop()
+        loop_id = id(loop)
+        _, lock = _BROWSER_LOCKS.setdefault(loop_id, (loop, asyncio.Lock()))
 
-        self.__browser = await browser_type.launch(**kwargs)
-        self.__browser_context = await self.__browser.new_context()
+        async with lock:
+            entry = _PLAYWRIGHTS.get(loop_id)
+
+            if entry is None:
+                entry = (loop, await async_playwright().start())
+                _PLAYWRIGHTS[loop_id] = entry
+
+            playwright = entry[1]
+
+            if not hasattr(playwright, browser_name):
+                raise ValueError(Fore.RED + 'Unsupported or invalid browser type, ' + Fore.CYAN + browser_name + Fore.RESET)
+
+            cdp_endpoint: str | None = browser_config.get('cdp_endpoint')
+            key = (loop_id, browser_name, cdp_endpoint, tuple(sorted(kwargs.items())))
+            browser = _BROWSERS.get(key)
+
+            if browser is None or not browser.is_connected():
+                browser_type: BrowserType = getattr(playwright, browser_name)
+
+                if cdp_endpoint:
+                    # attach to an externally managed browser (e.g. one
+                    # chromium --remote-debugging-port=9222 shared by many
+                    # jobs) instead of launching our own
+                    browser = await browser_type.connect_over_cdp(cdp_endpoint)
+                else:
+                    browser = await browser_type.launch(**kwargs)
+
+                _BROWSERS[key] = browser
+
+        context_kwargs = {}
+        viewport: List = browser_config.get('viewport', [])
+
+        if len(viewport) == 2:
+            # context-level viewport saves a set_viewport_size
+            # round-trip on every pooled page
+            context_kwargs['viewport'] = {
+                'width': viewport[0],
+                'height': viewport[1]
+            }
+
+        self.__browser = browser
+        self.__browser_context = await self.__browser.new_context(**context_kwargs)
+        self.__page_pool = asyncio.Queue()
+
+        blocked = frozenset(browser_config.get('block', []))
+
+        if blocked:
+            await self.__browser_context.route(
+                '**/*',
+                lambda route: self.__block_request(route, blocked)
+            )
+
+            # registered after the catch-all because Playwright dispatches
+            # the most recently added matching route first: blocked types
+            # identifiable from the URL alone abort here without ever
+            # entering the resource-type handler
+            for resource_type, glob in _RESOURCE_GLOBS.items():
+                if resource_type in blocked:
+                    await self.__browser_context.route(glob, lambda route: route.abort())
+
+
+    async def __block_request(self, route: Route, types: frozenset) -> None:
+        if route.request.resource_type in types:
+            await route.abort()
+        else:
+            await route.continue_()
 
 
     async def __close_browser(self) -> None:
-        if not self.__browser.is_connected(): return
-        if self.__config.get('logging', Rake.DEFAULT_LOGGING):
-            print(Fore.YELLOW + 'Closing browser' + Fore.RESET)
+        if not self.__browser or not self.__browser.is_connected(): return
+        if self.__log:
+            print(Fore.YELLOW + 'Closing browser context' + Fore.RESET)
 
         if self.__browser_context:
-            self.__browser.is_connected
-            await asyncio.gather(*[page.close() for page in self.__browser_context.pages])
+            # closing the context tears down its pages; the browser
+            # itself stays pooled for the next run (see Rake.shutdown)
             await self.__browser_context.close()
-            await self.__browser.close()
+
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """
+        Close every pooled browser and stop the Playwright driver for
+        the current event loop. Call once at process exit; individual
+        runs only close their own context.
+        """
+        loop_id = id(asyncio.get_running_loop())
+
+        for key in [key for key in _BROWSERS if key[0] == loop_id]:
+            browser = _BROWSERS.pop(key)
+
+            if browser.is_connected():
+                await browser.close()
+
+        entry = _PLAYWRIGHTS.pop(loop_id, None)
+        _BROWSER_LOCKS.pop(loop_id, None)
+
+        if entry: await entry[1].stop()
 
 
     def __resolve_page_link(self, url: str | Dict | List[str | Dict]) -> List:
@@ -234,7 +495,13 @@ class Rake:
 
         for url in urls:
             if type(url) is dict:
-                links.append(pick(url, {"url", "name", "metadata"}))
+                # the three fields are known, no need for generic pick()
+                # machinery on every configured link
+                links.append({
+                    'url': url['url'],
+                    'name': url.get('name'),
+                    'metadata': url.get('metadata', {})
+                })
             elif url[0] == '$':
                 links += self.__state['links'].get(url[1:], [])
             else:
@@ -243,6 +510,12 @@ class Rake:
         return links
     
 
+    def __has_link_refs(self, url: str | Dict | List[str | Dict]) -> bool:
+        urls: List[str | dict] = [url] if type(url) in [str, dict] else url
+
+        return any(type(u) is str and u.startswith('$') for u in urls)
+
+
     def __load_portal(self) -> None:
         if self.__config.get('portal', False) != True: return
 
@@ -266,7 +539,7 @@ class Rake:
         
         match filetype:
             case 'yaml':
-                if self.__config.get('logging', Rake.DEFAULT_LOGGING):
+                if self.__log:
                     print(Fore.GREEN + f'Outputting {state} to YAML: ' + Fore.BLUE + filepath + Fore.RESET)
 
                 if transform_fn:
@@ -276,49 +549,83 @@ class Rake:
                 # when file creation is also handled
                 if data is not None:
                     with open(filepath, 'w') as stream:
-                        yaml.dump(data, stream)
+                        yaml.dump(data, stream, Dumper=YamlDumper)
 
             case 'json':
-                if self.__config.get('logging', Rake.DEFAULT_LOGGING):
+                if self.__log:
                     print(Fore.GREEN + f'Outputting {state} to JSON: ' + Fore.BLUE + filepath + Fore.RESET)
 
                 if transform_fn:
                     data = transform_fn(*transform_args[0:count_args])
 
                 if data is not None:
-                    with open(filepath, 'w') as stream:
-                        json.dump(data, stream, indent=2, ensure_ascii=False)
+                    if orjson:
+                        with open(filepath, 'wb') as stream:
+                            stream.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                    else:
+                        with open(filepath, 'w') as stream:
+                            json.dump(data, stream, indent=2, ensure_ascii=False)
 
             case 'csv':
-                if self.__config.get('logging', Rake.DEFAULT_LOGGING):
+                if self.__log:
                     print(Fore.GREEN + f'Outputting {state} to CSV: ' + Fore.BLUE + filepath + Fore.RESET)
 
                 if transform_fn and data:
                     data = transform_fn(*transform_args[0:count_args])
-                
+
                 if data is not None:
+                    # deferred so short runs never pay the pandas import
+                    import pandas as pd
+
                     df = pd.DataFrame(data)
                     df.to_csv(filepath, index=False, header=False)
 
             case 'excel':
-                if self.__config.get('logging', Rake.DEFAULT_LOGGING):
+                if self.__log:
                     print(Fore.GREEN + f'Outputting {state} to Excel: ' + Fore.BLUE + filepath + Fore.RESET)
 
                 if transform_fn and data:
                     data = transform_fn(*transform_args[0:count_args])
 
                 if data is not None:
-                    df = pd.DataFrame(data)
-                    df.to_excel(filepath, index=False)
+                    self.__write_excel(data, filepath)
 
             case _:
                 if transform_fn:
-                    if self.__config.get('logging', Rake.DEFAULT_LOGGING):
+                    if self.__log:
                         print(Fore.GREEN + f'Outputting {state} to {filetype}: ' + Fore.BLUE + filepath + Fore.RESET)
 
                     transform_fn(*transform_args[0:count_args])
 
 
+    @staticmethod
+    def __write_excel(data: Dict | List, filepath: str) -> None:
+        # write-only workbook streams rows straight to disk instead of
+        # materializing the whole dataset again in a DataFrame
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+
+        if type(data) is list and data and type(data[0]) is dict:
+            headers = list(data[0].keys())
+            sheet.append(headers)
+
+            for row in data:
+                sheet.append([row.get(header) for header in headers])
+        elif type(data) is dict:
+            sheet.append(list(data.keys()))
+            columns = [value if type(value) is list else [value] for value in data.values()]
+
+            for row in zip_longest(*columns):
+                sheet.append(list(row))
+        else:
+            for item in data if type(data) is list else [data]:
+                sheet.append([item])
+
+        workbook.save(filepath)
+
+
     def __get_outputs(self) ->  List[Dict[str, str]]:
         output_path: str = self.__config.get('output', {}).get('path', './')
 
@@ -367,6 +674,8 @@ class Rake:
             rake_state: State,
             browser_context: BrowserContext,
             queue: asyncio.Queue,
+            page_pool: asyncio.Queue,
+            node_plans: Dict[int, Tuple[NodeConfig, NodePlan]],
             portal: ModuleType | None = None
         ):
             self.__link = link
@@ -374,11 +683,23 @@ class Rake:
             self.__rake_config = rake_config
             self.__rake_state = rake_state
             self.__browser_context = browser_context
-            self.__vars = link.get('metadata', {})
-            self.__vars['_url'] = link['url']
+            # overlay keeps link metadata shared and read-only,
+            # _url and later var writes land in the manager's own layer
+            self.__vars = ChainMap({'_url': link['url']}, link.get('metadata', {}))
             self.__page: Page | None = None
             self.__queue = queue
+            self.__page_pool = page_pool
+            self.__node_plans = node_plans
             self.__portal = portal
+            self.__log = rake_config.get('logging', Rake.DEFAULT_LOGGING)
+            browser_config: Dict[str, Any] = rake_config.get('browser', {})
+            self.__goto_kwargs = {}
+
+            if 'ready_on' in browser_config:
+                self.__goto_kwargs['wait_until'] = browser_config['ready_on']
+
+            if 'timeout' in browser_config:
+                self.__goto_kwargs['timeout'] = browser_config['timeout']
 
         async def open(self) -> Page:
             if 'interact' not in self.__config:
@@ -386,158 +707,124 @@ class Rake:
 
             url = self.__link['url']
 
-            if self.__rake_config.get('logging', Rake.DEFAULT_LOGGING):
+            if self.__log:
                 print(Fore.GREEN + Style.BRIGHT + 'Opening a new page: ' + Style.NORMAL + Fore.BLUE + url + Fore.RESET)
 
-            page: Page = await self.__browser_context.new_page()
+            page: Page = await self.__acquire_page()
             self.__page = page
-            browser_config: Dict[str, Any] = self.__rake_config.get('browser', {})
-            viewport: List = browser_config.get('viewport', [])
-            blacklisted_resources: List = browser_config.get('block', [])
-
-            if len(viewport) == 2:
-                await page.set_viewport_size({
-                    'width': viewport[0],
-                    'height': viewport[1]
-                })
 
-            if len(blacklisted_resources):
-                await page.route(
-                    '**/*',
-                    lambda route: self.__block_request(route, blacklisted_resources)
-                )
-
-            kwargs = {}
-
-            if 'ready_on' in browser_config:
-                kwargs['wait_until'] = browser_config['ready_on']
-
-            if 'timeout' in browser_config:
-                kwargs['timeout'] = browser_config['timeout']
-            
-            await page.goto(url, **kwargs)
-            await self.__interact(self.__config.get('interact'))
+            await page.goto(url, **self.__goto_kwargs)
+            await self.__interact(self.__config.get('interact'), self.__vars)
             await self.__close()
 
             return page
 
 
+        async def __acquire_page(self) -> Page:
+            # reuse an idle page when available, page creation
+            # is paid only when the pool runs dry
+            try:
+                return self.__page_pool.get_nowait()
+            except asyncio.QueueEmpty:
+                return await self.__browser_context.new_page()
+
+
         async def __close(self) -> None:
             if not self.__page: return
 
-            if self.__rake_config.get('logging', Rake.DEFAULT_LOGGING):
-                print(Fore.YELLOW + 'Closing page: ' + Fore.BLUE + self.__page.url + Fore.RESET)
+            if self.__log:
+                print(Fore.YELLOW + 'Releasing page: ' + Fore.BLUE + self.__page.url + Fore.RESET)
 
-            await self.__page.close()
+            self.__page_pool.put_nowait(self.__page)
+            self.__page = None
 
 
-        async def __block_request(self, route: Route, types: List[str]) -> None:
-            if route.request.resource_type in types:
-                await route.abort()
-            else:
-                await route.continue_()
-    
-
-        async def __interact(self, interactions: InteractConfig) -> None:
+        async def __interact(self, interactions: InteractConfig, vars: Dict[str, Any]) -> None:
             if 'repeat' in interactions:
                 repeat = interactions['repeat']
 
                 if type(repeat) is int:
                     for _ in range(repeat):
-                        await self.__browse(interactions['nodes'])
+                        await self.__browse(interactions['nodes'], vars)
                 elif type(repeat) is list:
                     should_repeat = True
 
                     while True:
                         if not should_repeat: break
 
-                        should_repeat = await self.__should_repeat(repeat)
+                        should_repeat = await self.__should_repeat(repeat, vars)
 
-                        await self.__browse(interactions['nodes'])
+                        await self.__browse(interactions['nodes'], vars)
 
             else:
-                await self.__browse(interactions['nodes'])
+                await self.__browse(interactions['nodes'], vars)
 
 
-        async def __browse(self, nodes: List[NodeConfig]) -> None:
+        async def __browse(self, nodes: List[NodeConfig], vars: Dict[str, Any]) -> None:
             for alts in nodes:
                 alts = alts if type(alts) == list else [alts]
 
                 for node in alts:
-                    self.__vars['_node'] = re.sub(':', '-', node.get('name', node['element']))
-                    loc_kwargs = {}
-
-                    if 'contains' in node: loc_kwargs['has_text'] = node['contains']
+                    plan = _compile_node(node, self.__node_plans)
+                    vars['_node'] = plan.name
 
-                    if 'excludes' in node: loc_kwargs['has_not_text'] = node['excludes']
+                    if await self.__fast_extract(node, vars): break
 
-                    locator: Locator = self.__page.locator(node['element'], **loc_kwargs)
+                    locator: Locator = self.__page.locator(plan.element, **plan.loc_kwargs)
 
-                    if self.__rake_config.get('logging', Rake.DEFAULT_LOGGING):
-                        print(Fore.GREEN + 'Interacting with: ' + Fore.WHITE + Style.DIM + node['element'] + Style.NORMAL + Fore.RESET)
+                    if self.__log:
+                        print(Fore.GREEN + 'Interacting with: ' + Fore.WHITE + Style.DIM + plan.element + Style.NORMAL + Fore.RESET)
 
-                    if 'wait' in node:
-                        await locator.wait_for(timeout=node['wait'])
+                    if plan.wait is not None:
+                        await locator.wait_for(timeout=plan.wait)
 
                     locs = await locator.all()
                     count = len(locs)
 
                     if not count: continue
 
-                    all: bool = node.get('all', False)
-                    rng_start, rng_stop, rng_step = self.__resolve_range(node.get('range', []), len(locs))
+                    all: bool = plan.all
+                    rng_start, rng_stop, rng_step = self.__resolve_range(plan.range, len(locs))
                     locs = locs[rng_start:rng_stop]
-                    scroll_into_view = node.get('show', False)
+                    scroll_into_view = plan.show
 
                     if not all: locs = locs[0:1]
 
                     for i in range(0, len(locs), rng_step):
-                        self.__vars['_nth'] = i
+                        vars['_nth'] = i
                         loc = locs[i]
 
                         if scroll_into_view and await loc.is_visible():
                             await loc.scroll_into_view_if_needed()
 
-                        await self.__node_actions(node.get('actions', []), loc)
+                        await self.__node_actions(plan.actions, loc, vars)
 
-                        if 'links' in node:
-                            await self.__add_links(loc, node['links'])
+                        if plan.links:
+                            await self.__add_links(loc, plan.links, vars)
 
-                        if 'data' in node:
-                            await self.__extract_data(loc, node['data'], all)
+                        if plan.data:
+                            await self.__extract_data(loc, plan.data, vars, all)
+
+                        if plan.interact:
+                            # nested interactions get their own vars overlay so sibling
+                            # branches never see each other's _node/_nth mutations
+                            await self.__interact(plan.interact, {**vars})
 
-                        if 'interact' in node:
-                            await self.__interact(node['interact'])
-                    
                     if count: break
 
 
-        async def __should_repeat(self, conditions: List[Dict[str, Any]]) -> bool:
+        async def __should_repeat(self, conditions: List[Dict[str, Any]], vars: Dict[str, Any]) -> bool:
             for condition in conditions:
                 value_getter = condition.get('value')
                 repeat_while = condition.get('while')
 
                 if not value_getter or not repeat_while or len(repeat_while) != 2: continue
 
-                value = await self.__attribute(value_getter, self.__page.locator('html'))
-
-                match repeat_while[0]:
-                    case 'equal':
-                        if value != repeat_while[1]: return False
-                    case 'is':
-                        if value != repeat_while[1]: return False
-                    case 'not_equal':
-                        if value == repeat_while[1]: return False
-                    case 'not':
-                        if value == repeat_while[1]: return False
-                    case 'greater_than':
-                        if value <= repeat_while[1]: return False
-                    case 'less_than':
-                        if value >= repeat_while[1]: return False
-                    case 'greater_than_or_equal':
-                        if value < repeat_while[1]: return False
-                    case 'less_than_or_equal':
-                        if value > repeat_while[1]: return False
+                value = await self.__attribute(value_getter, self.__page.locator('html'), vars)
+
+                compare = _CMP.get(repeat_while[0])
+
+                if compare and not compare(value, repeat_while[1]): return False
 
             return True
 
@@ -554,31 +841,41 @@ class Rake:
             return (rng_start, rng_stop, rng_step)
 
 
-        async def __node_actions(self, actions: List[ActionConfig], loc: Locator) -> None:
+        async def __node_actions(self, actions: List[ActionConfig], loc: Locator, vars: Dict[str, Any]) -> None:
             for action in actions:
                 # pre-evaluate and cache screenshot file path,
                 # before the node is removed or made inaccessible by action event
                 screenshot_path = ''
 
                 if 'screenshot' in action: 
-                    screenshot_path = await self.__evaluate(action['screenshot'], loc)
+                    screenshot_path = await self.__evaluate(action['screenshot'], loc, vars)
 
                 count = action.get('count', 1)
 
                 if type(count) is str:
-                    count = int(await self.__evaluate(count, loc))
+                    count = int(await self.__evaluate(count, loc, vars))
                 elif type(count) is dict:
-                    count = int(await self.__attribute(count, loc))
+                    count = int(await self.__attribute(count, loc, vars))
 
                 t: str = action['type']
-                rect: DOMRect = await loc.evaluate("node => node.getBoundingClientRect()")
+                rect: DOMRect | None = None
+
+                if t in ['swipe_left', 'swipe_right']:
+                    # only swipe gestures need the geometry; fetch just the
+                    # fields used so clicks skip the round-trip entirely
+                    rect = await loc.evaluate('node => { const rect = node.getBoundingClientRect(); return {x: rect.x, y: rect.y, width: rect.width, height: rect.height}; }')
+
+                # the visibility check only feeds a log line,
+                # skip the round-trip when logging is off
+                visible = await loc.evaluate('node => node.checkVisibility ? node.checkVisibility() : true') if self.__log else True
 
                 for _ in range(count):
-                    if 'delay' in action: 
-                        await loc.page.wait_for_timeout(action['delay'])
+                    if 'delay' in action:
+                        # plain wall-time wait, no need for a browser round-trip
+                        await asyncio.sleep(action['delay'] / 1000)
 
-                    if not await loc.is_visible() and self.__rake_config.get('logging', Rake.DEFAULT_LOGGING):
-                        print(Fore.YELLOW + 'Action may fail due to node being inaccessible or not visible: ' + Fore.WHITE + f'{self.__vars['_node']}@{action['type']}')
+                    if self.__log and not visible:
+                        print(Fore.YELLOW + 'Action may fail due to node being inaccessible or not visible: ' + Fore.WHITE + f'{vars['_node']}@{action['type']}')
                     
                     if action.get('dispatch', False) and t not in ['swipe_left', 'swipe_right']:
                         await loc.dispatch_event(action['type'])
@@ -604,70 +901,215 @@ class Rake:
                         raise ValueError(Fore.RED + 'The ' + Fore.CYAN + t + Fore.RED + ' action is currently not supported' + Fore.RESET)
                             
                     if 'wait' in action:
-                        await loc.page.wait_for_timeout(action['wait'])
+                        await asyncio.sleep(action['wait'] / 1000)
 
                 if 'screenshot' in action: 
                     await loc.page.screenshot(path=screenshot_path, full_page=True)
 
 
-        async def __extract_data(self, loc: Locator, configs: List[DataConfig], all: bool = False) -> None:
+        def __fast_expr(self, value: Any) -> Dict | None:
+            """
+            Parse a value string into a plain attribute read that can run
+            inside a batched browser script, or None when the value needs
+            the full locator path.
+            """
+            if type(value) is not str: return None
+
+            getters = notation.parse_getters(value)
+
+            if len(getters) != 1: return None
+
+            full_match, typ, expr = next(iter(getters))
+
+            if typ != 'attr' or full_match != value: return None
+
+            parsed = notation.parse_value(expr)
+
+            if parsed.get('element') or parsed.get('var'): return None
+
+            if parsed['prop'] not in ['text', 'href', 'src']: return None
+
+            return parsed
+
+
+        async def __fast_extract(self, node: NodeConfig, vars: Dict[str, Any]) -> bool:
+            """
+            Extract data and links for a read-only node in a single round-trip.
+
+            A node qualifies when its data and link values are simple
+            $attr{...} reads (text/href/src, no sub-element, no set_var,
+            no smith) and it performs no actions, waits or nested
+            interactions. All matched nodes are read column-wise with one
+            evaluate_all script instead of one round-trip per node per
+            field; utils, scope resolution and link bookkeeping still run
+            in Python. Returns False when the node needs the full locator
+            path.
+            """
+            if 'data' not in node and 'links' not in node: return False
+
+            for key in ['actions', 'interact', 'contains', 'excludes', 'show', 'wait', 'range']:
+                if key in node: return False
+
+            fields: List[Tuple[DataConfig, Dict]] = []
+
+            for config in node.get('data', []):
+                parsed = self.__fast_expr(config.get('value'))
+
+                if not parsed: return False
+
+                fields.append((config, parsed))
+
+            link_fields: List[Tuple[LinkConfig, Dict, Dict[str, Dict]]] = []
+
+            for link in node.get('links', []):
+                if 'smith' in link: return False
+
+                url_parsed = self.__fast_expr(link.get('url'))
+
+                if not url_parsed: return False
+
+                meta_parsed: Dict[str, Dict] = {}
+
+                for key, value in link.get('metadata', {}).items():
+                    parsed = self.__fast_expr(value)
+
+                    if not parsed: return False
+
+                    meta_parsed[key] = parsed
+
+                link_fields.append((link, url_parsed, meta_parsed))
+
+            if not fields and not link_fields: return False
+
+            columns: List[Dict] = [parsed for _, parsed in fields]
+
+            for _, url_parsed, meta_parsed in link_fields:
+                columns.append(url_parsed)
+                columns += list(meta_parsed.values())
+
+            attrs = [
+                [parsed['child_node'], 'textContent' if parsed['prop'] == 'text' else parsed['prop']]
+                for parsed in columns
+            ]
+
+            rows = await self.__page.locator(node['element']).evaluate_all(
+                '(nodes, attrs) => nodes.map(node => attrs.map(([childNode, attr]) => childNode ? node.childNodes[childNode - 1][attr] : node[attr]))',
+                attrs
+            )
+
+            if not rows: return False
+
+            all: bool = node.get('all', False)
+
+            if not all: rows = rows[0:1]
+
+            for i, row in enumerate(rows):
+                vars['_nth'] = i
+                column = len(fields)
+
+                for link, url_parsed, meta_parsed in link_fields:
+                    name = link['name']
+                    url = row[column]
+                    column += 1
+
+                    if len(url_parsed['parsed_utils']):
+                        url = self.__apply_utils(url_parsed['parsed_utils'], url)
+
+                    metadata: Dict = {}
+
+                    for key, parsed in meta_parsed.items():
+                        value = row[column]
+                        column += 1
+
+                        if len(parsed['parsed_utils']):
+                            value = self.__apply_utils(parsed['parsed_utils'], value)
+
+                        metadata[key] = value
+
+                    if name not in self.__rake_state['links']:
+                        self.__rake_state['links'][name] = []
+
+                    await self.__store_link(name, url, metadata)
+
+                for (config, parsed), value in zip(fields, row):
+                    if len(parsed['parsed_utils']):
+                        value = self.__apply_utils(parsed['parsed_utils'], value)
+
+                    value = [value] if all else value
+
+                    if type(value) is list and value[0] is None: value = []
+
+                    self.__rake_state['size'] += get_total_size(value)
+
+                    scope = self.__resolve_scope(config['scope'], vars)
+
+                    if self.__log:
+                        print(Fore.GREEN + 'Extracting data to ' + Fore.CYAN + keypath.to_string(scope) + Fore.RESET)
+
+                    keypath.assign(value, self.__rake_state['data'], scope, merge=True)
+
+            return True
+
+
+        def __resolve_scope(self, scope: str | List[str], vars: Dict[str, Any]) -> List | Tuple:
+            """
+            Resolve a data scope to its keypath. Plain scopes (no $key{...}
+            lookup) resolve to their own cached split, so only scopes that
+            actually match against existing data walk the tree.
+            """
+            if type(scope) is str and '$key{' not in scope:
+                return keypath.split(scope)
+
+            return keypath.resolve(
+                scope,
+                self.__rake_state['data'],
+                vars,
+                resolve_key=notation.find_item_key
+            )
+
+
+        async def __extract_data(self, loc: Locator, configs: List[DataConfig], vars: Dict[str, Any], all: bool = False) -> None:
             for config in configs:
                 value = None
 
                 if type(config['value']) is str:
-                    value = await self.__evaluate(config['value'], loc)
+                    value = await self.__evaluate(config['value'], loc, vars)
                 elif type(config['value']) is list:
-                    value = await asyncio.gather(*[self.__evaluate(attr, loc) for attr in config['value']])
+                    value = await asyncio.gather(*[self.__evaluate(attr, loc, vars) for attr in config['value']])
                 elif type(config['value']) is dict:
-                    value = {}
-
-                    for key, attr in config['value'].items():
-                        if type(attr) is str:
-                            value[key] = await self.__evaluate(attr, loc)
-
-                            continue
-
-                        value[key] = await self.__attribute(attr, loc)
+                    value = await self.__evaluate_group(config['value'], loc, vars)
 
                 value = [value] if all else value
 
                 if type(value) is list and value[0] is None: value = []
 
-                scope = keypath.resolve(
-                    config['scope'],
-                    self.__rake_state['data'],
-                    self.__vars,
-                    resolve_key=notation.find_item_key
-                )
+                self.__rake_state['size'] += get_total_size(value)
 
-                if self.__rake_config.get('logging', Rake.DEFAULT_LOGGING):
+                scope = self.__resolve_scope(config['scope'], vars)
+
+                if self.__log:
                     print(Fore.GREEN + 'Extracting data to ' + Fore.CYAN + keypath.to_string(scope) + Fore.RESET)
 
                 keypath.assign(value, self.__rake_state['data'], scope, merge=True)
 
 
-        async def __add_links(self, loc: Locator, links: List[LinkConfig]) -> None:
+        async def __add_links(self, loc: Locator, links: List[LinkConfig], vars: Dict[str, Any]) -> None:
             for link in links:
                 name = link['name']
                 smith = link.get('smith')
                 metadata: Dict = {}
-                result = await self.__evaluate(link['url'], loc)
+                result = await self.__evaluate(link['url'], loc, vars)
 
                 if name not in self.__rake_state['links']:
                     self.__rake_state['links'][name] = []
 
                 if 'metadata' in link:
-                    for key, value in link['metadata'].items():
-                        if type(value) is str:
-                            metadata[key] = await self.__evaluate(value, loc)
-                        else:
-                            metadata[key] = await self.__attribute(value, loc)
+                    metadata = await self.__evaluate_group(link['metadata'], loc, vars)
 
                 if type(result) is not list:
                     result = [result]
 
                 for url in result:
-                    state_links: List[Link] = self.__rake_state['links'][name]
                     link_data = {'url': url, 'name': name, 'metadata': metadata}
 
                     if smith:
@@ -684,47 +1126,93 @@ class Rake:
                         link_data = [link_data]
 
                     for link_item in link_data:
-                        if type(link_item) is str:
-                            link_item = {'url': link_item, 'name': name, 'metadata': metadata}
-                        else:
-                            link_item = util.pick(link_item, {'url', 'name', 'metadata'})
+                        await self.__store_link(name, link_item, metadata)
+
+
+        async def __store_link(self, name: str, link_item: Link | str, metadata: Dict) -> None:
+            if type(link_item) is str:
+                link_item = {'url': link_item, 'name': name, 'metadata': metadata}
+            else:
+                link_item = util.pick(link_item, {'url', 'name', 'metadata'})
 
-                        found_link = None
+            # per-name url set keeps dedupe O(1),
+            # the link list itself stays in its public shape
+            seen_urls: set = self.__rake_state['seen'].setdefault(name, set())
 
-                        for existing_link in state_links:
-                            if existing_link['url'] == link_item['url']:
-                                found_link = existing_link
-                                break
+            if link_item['url'] in seen_urls: return
 
-                        if found_link: continue
+            seen_urls.add(link_item['url'])
+            self.__rake_state['links'][name].append(link_item)
 
-                        state_links.append(link_item)
+            if self.__link.get('name') == name:
+                await self.__queue.put((link_item, self.__config))
 
-                        if self.__link.get('name') == name:
-                            await self.__queue.put(link_item)
 
+        async def __evaluate_group(self, group: Dict[str, Any], loc: Locator, vars: Dict[str, Any]) -> Dict[str, Any]:
+            """
+            Evaluate a dict of value getters, concurrently when no entry
+            sets or reads a var (a set_var in one key feeding a $var in a
+            later key relies on sequential order), otherwise one by one.
+            """
+            ordered = False
+
+            for value in group.values():
+                if type(value) is str:
+                    if '$var{' in value or '>>' in value:
+                        ordered = True
+                        break
+                elif type(value) is dict and value.get('set_var'):
+                    ordered = True
+                    break
+
+            if ordered:
+                result = {}
+
+                for key, value in group.items():
+                    if type(value) is str:
+                        result[key] = await self.__evaluate(value, loc, vars)
+                    else:
+                        result[key] = await self.__attribute(value, loc, vars)
+
+                return result
+
+            values = await asyncio.gather(*[
+                self.__evaluate(value, loc, vars) if type(value) is str else self.__attribute(value, loc, vars)
+                for value in group.values()
+            ])
+
+            return dict(zip(group.keys(), values))
+
+
+        async def __evaluate(self, string: str, loc: Locator, vars: Dict[str, Any]) -> str | List[str]:
+            # plain literals are the common case, skip the getter parse
+            if '$' not in string: return string
 
-        async def __evaluate(self, string: str, loc: Locator) -> str | List[str]:
-            string_value = string
             getters = notation.parse_getters(string)
 
-            for full_match, typ, var_name in getters:
-                value = full_match
+            if not getters: return string
 
-                match typ:
-                    case 'attr':
-                        value = await self.__attribute(var_name, loc)
-                        if full_match == string: return value
-                    case 'var':
-                        value = str(self.__var(var_name, full_match))
-                        if full_match == string: return value
+            # independent attribute getters overlap their round-trips;
+            # var getters resolve locally afterwards
+            attr_getters = [(full_match, var_name) for full_match, typ, var_name in getters if typ == 'attr']
+            attr_values = await asyncio.gather(*[self.__attribute(var_name, loc, vars) for _, var_name in attr_getters])
+            values = {full_match: value for (full_match, _), value in zip(attr_getters, attr_values)}
 
-                string_value = re.sub(re.escape(full_match), '' if value is None else str(value), string_value)
+            for full_match, typ, var_name in getters:
+                if typ == 'var':
+                    values[full_match] = str(self.__var(var_name, vars, full_match))
+
+            # a value that is exactly one getter passes through untouched,
+            # keeping lists and other non-string results intact
+            if len(getters) == 1 and string in values: return values[string]
 
-            return string_value
+            return notation.sub_getters(
+                string,
+                {full_match: '' if value is None else str(value) for full_match, value in values.items()}
+            )
 
 
-        async def __attribute(self, node_attr: Attribute, loc: Locator) -> str | List:
+        async def __attribute(self, node_attr: Attribute, loc: Locator, vars: Dict[str, Any]) -> str | List:
             values = []
             utils = {}
             locs = [loc]
@@ -747,53 +1235,79 @@ class Rake:
                 utils = node_attr.get('utils', {})
                 var_name = node_attr.get('set_var')
             else:
-                raise ValueError(Fore.RED + 'Invalid attribute type definition, only dict and str allowed at ' + Fore.WHITE + (element or self.__vars['_node']) + Fore.RESET)
+                raise ValueError(Fore.RED + 'Invalid attribute type definition, only dict and str allowed at ' + Fore.WHITE + (element or vars['_node']) + Fore.RESET)
 
             if not attr:
-                raise ValueError(Fore.RED + 'Attribute to extract not define at ' + Fore.WHITE + (element or self.__vars['_node']) + Fore.RESET)
+                raise ValueError(Fore.RED + 'Attribute to extract not define at ' + Fore.WHITE + (element or vars['_node']) + Fore.RESET)
+
+            target: Locator | None = loc
 
             if element:
                 match ctx:
                     case 'parent':
-                        locs = await loc.locator(element).all()
+                        target = loc.locator(element)
                     case 'page':
-                        locs = await loc.page.locator(element).all()
+                        target = loc.page.locator(element)
+                    case _:
+                        target = None
 
-            if attr == 'count': return int(self.__apply_utils(utils, len(locs)))
+            if attr == 'count':
+                count = await target.count() if element and target else len(locs)
 
-            if max == 'one': locs = locs[0:1]
+                return int(self.__apply_utils(utils, count))
 
-            for loc in locs:
-                value = None
+            if target and attr in ['href', 'src', 'text', 'disabled']:
+                # one evaluate_all round-trip regardless of how many nodes match
+                values = await target.evaluate_all(
+                    '(nodes, [childNode, attr]) => nodes.map(node => {'
+                    '    const source = childNode ? node.childNodes[childNode - 1] : node;'
+                    "    return attr === 'disabled' ? !!source.disabled : source[attr];"
+                    '})',
+                    [child_node, 'textContent' if attr == 'text' else attr]
+                )
+
+                # truncate before utils so single-value reads never run
+                # utils against matches they would have ignored
+                if max == 'one': values = values[0:1]
+
+                if len(utils):
+                    values = [self.__apply_utils(utils, value) for value in values]
+            else:
+                if element and target: locs = await target.all()
 
-                if attr in ['href', 'src', 'text']:
-                    value = await loc.evaluate(
-                        '(node, [childNode, attr]) => childNode ? node.childNodes[childNode - 1][attr] : node[attr]',
-                        [child_node, 'textContent' if attr == 'text' else attr]
-                    )
-                elif attr == 'disabled':
-                    value = await loc.is_disabled()
+                if max == 'one': locs = locs[0:1]
 
-                if len(utils): 
-                    value = self.__apply_utils(utils, value)
+                for loc in locs:
+                    value = None
 
-                values.append(value)
+                    if attr in ['href', 'src', 'text']:
+                        value = await loc.evaluate(
+                            '(node, [childNode, attr]) => childNode ? node.childNodes[childNode - 1][attr] : node[attr]',
+                            [child_node, 'textContent' if attr == 'text' else attr]
+                        )
+                    elif attr == 'disabled':
+                        value = await loc.is_disabled()
+
+                    if len(utils):
+                        value = self.__apply_utils(utils, value)
+
+                    values.append(value)
 
             if max == 'one': values: str = dict(enumerate(values)).get(0, '')
 
-            if var_name: self.__vars[var_name] = values
+            if var_name: vars[var_name] = values
 
             return values
 
 
-        def __var(self, name: str, default: Any = None) -> Any:
+        def __var(self, name: str, vars: Dict[str, Any], default: Any = None) -> Any:
             result = notation.parse_value(name, set_defaults=False)
 
             if not is_none_keys(result, 'child_node', 'ctx', 'max', 'element'):
                 raise ValueError(Fore.RED + 'Invalid $var{...} notation at ' + Fore.CYAN + name + Fore.RESET)
 
-            if result['prop'] in self.__vars:
-                return self.__apply_utils(result['parsed_utils'], self.__vars[name])
+            if result['prop'] in vars:
+                return self.__apply_utils(result['parsed_utils'], vars[name])
 
             return default
 
@@ -802,29 +1316,14 @@ class Rake:
             value = val
 
             for name, args in utils.items():
-                match name.strip():
-                    case 'prepend':
-                        if len(args) > 0:
-                            value = f'{args[0]}{value or ''}'
-                    case 'lowercase':
-                        value = str(value).lower()
-                    case 'slug':
-                        value = slugify(str(value))
-                    case 'subtract':
-                        if is_numeric(value): value = float(value)
-                        else: value = 0.0
-
-                        if len(args) > 0 and is_numeric(args[0]):
-                            value = float(value) - float(args[0])
-                    case 'clear_url_params':
-                        value = value.split('?')[0]
-                    case 'trim':
-                        value = value.strip()
-                    case 'nullify':
-                        if not value: value = None
-                    case _:
-                        fn, _ = util.portal_action(name.strip(), self.__rake_config, self.__portal)
-                        value = fn(value, *args)
-            
+                name = name.strip()
+                util_fn = _UTILS.get(name)
+
+                if util_fn:
+                    value = util_fn(value, args)
+                else:
+                    fn, _ = util.portal_action(name, self.__rake_config, self.__portal)
+                    value = fn(value, *args)
+
             return value
         
\ No newline at end of file
@@ -1,27 +1,32 @@
-import re
+import re, functools
 from rake.utils.helpers import count_required_args
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
 
-def split(path: str, delimiter: str = '.') -> List[str]:
+@functools.lru_cache(maxsize=4096)
+def split(path: str, delimiter: str = '.') -> Tuple[str, ...]:
     """
-    Splits a given path into an array of strings, using the given delimiter
+    Splits a given path into a tuple of strings, using the given delimiter
     (defaulting to '.'). The path can contain square brackets, which are
     treated as a single delimiter. Any resulting consecutive
     delimiters will be collapsed into one.
 
+    Paths come from static config and are re-split on every get/assign/
+    resolve call, so results are memoized; the tuple keeps cached
+    entries immutable.
+
     Args:
-        path (str): The string to split into an array.
+        path (str): The string to split into a tuple.
         delimiter (str): The string to split by. Defaults to '.'.
 
     Returns:
-        List[str]: The resulting array of strings.
+        Tuple[str, ...]: The resulting tuple of strings.
     """
-    
+
     sanitized_path = re.sub(r'\]+$', '', path)
     sanitized_path = re.sub(r'[\[\]]+', delimiter, path)
     sanitized_path = re.sub(r'\.{2,}', delimiter, path)
-    
-    return sanitized_path.split(delimiter)
+
+    return tuple(sanitized_path.split(delimiter))
 
 
 def get(path: str | List[str], obj: List | Dict, default: Any = None, delimiter: str = '.') -> Any:
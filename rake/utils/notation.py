@@ -1,4 +1,4 @@
-import re
+import re, functools
 from typing import Dict, List, Literal, Tuple
 from colorama import Fore
 
@@ -6,7 +6,18 @@ from colorama import Fore
 ParseValueData = Dict[Literal['prop', 'child_node', 'ctx', 'element', 'max', 'utils', 'parsed_utils', 'var'], int | str | Dict[str, List[str]] | None]
 KeyMatchData = Dict[Literal['is_left_var', 'left_operand', 'operator', 'is_right_var', 'right_operand'], str]
 
+_VALUE_RE = re.compile(r'(?:(?P<prop>\w+)(?::child\((?P<child_node>\d+)\))?)\s*(?:@\s*(?:<(?P<ctx>page|parent)(?:\.(?P<max>all|one))?>)?(?P<element>[^|<]+))?(?:\s*\|\s*(?P<utils>\w+(?:\s+[^>]+)*))*\s*(?:>>\s*(?P<var>\w+))?')
 
+_UTILS_SPLIT_RE = re.compile(r'\s*\|\s*')
+
+_UTIL_ARGS_RE = re.compile(r'\s+')
+
+_GETTERS_RE = re.compile(r'(\$(var|attr)\{\s*([^|}]+(?:\s*\|\s*\w+(?:\s+[^\s{}]+)*)*\s*)\})')
+
+_KEY_RE = re.compile(r'\$key\{\s*(?P<is_left_var>\$)?(?P<left_operand>\w+)\s*(?P<operator>=|!=|>=|<=|>|<)\s*(?P<is_right_var>\$)?(?P<right_operand>\w+)\s*\}')
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_value(string: str, set_defaults: bool = True) -> ParseValueData:
     """
     Parse a value notation string into its parts.
@@ -37,8 +48,7 @@ def parse_value(string: str, set_defaults: bool = True) -> ParseValueData:
     that are not present in the input string.
     """
     
-    value_re = r'(?:(?P<prop>\w+)(?::child\((?P<child_node>\d+)\))?)\s*(?:@\s*(?:<(?P<ctx>page|parent)(?:\.(?P<max>all|one))?>)?(?P<element>[^|<]+))?(?:\s*\|\s*(?P<utils>\w+(?:\s+[^>]+)*))*\s*(?:>>\s*(?P<var>\w+))?'
-    match = re.fullmatch(value_re, string)
+    match = _VALUE_RE.fullmatch(string)
 
     if not match:
         return {'prop': None, 'ctx': None, 'element': None, 'utils': None, 'parsed_utils': []}
@@ -62,16 +72,17 @@ def parse_value(string: str, set_defaults: bool = True) -> ParseValueData:
 def parse_utils(string: str | None) -> Dict[str, List[str]]:
     if not string: return {}
 
-    utils = re.split(r'\s*\|\s*', string)
+    utils = _UTILS_SPLIT_RE.split(string)
     parsed_utils: Dict[str, List[str]] = {}
 
     for util in utils:
-        util_parts = re.split(r'\s+', util.strip())
+        util_parts = _UTIL_ARGS_RE.split(util.strip())
         parsed_utils[util_parts[0]] = util_parts[1:]
 
     return parsed_utils
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_getters(string: str) -> List[Tuple[str, str, str]]:
     """
     Returns a set of tuples containing the full match, the getter type (var or attr) and the getter value.
@@ -82,7 +93,23 @@ def parse_getters(string: str) -> List[Tuple[str, str, str]]:
     Returns:
         List[Tuple[str, str, str]]: A set of tuples containing the full match, the getter type and the getter value.
     """
-    return set(re.findall(r'(\$(var|attr)\{\s*([^|}]+(?:\s*\|\s*\w+(?:\s+[^\s{}]+)*)*\s*)\})', string))
+    return set(_GETTERS_RE.findall(string))
+
+
+def sub_getters(string: str, values: Dict[str, str]) -> str:
+    """
+    Replaces every getter occurrence in the string in a single pass,
+    using the given full-match to replacement mapping. Matches without
+    a mapping entry are left untouched.
+
+    Args:
+        string (str): The string containing getters to replace.
+        values (Dict[str, str]): Mapping of full getter matches to replacements.
+
+    Returns:
+        str: The string with all mapped getters replaced.
+    """
+    return _GETTERS_RE.sub(lambda match: values.get(match.group(0), match.group(0)), string)
 
 
 def find_item_key(key, value, vars):
@@ -107,8 +134,7 @@ def find_item_key(key, value, vars):
     Returns:
         str | int: The key of the item that matches the comparison.
     """
-    key_re = r'\$key\{\s*(?P<is_left_var>\$)?(?P<left_operand>\w+)\s*(?P<operator>=|!=|>=|<=|>|<)\s*(?P<is_right_var>\$)?(?P<right_operand>\w+)\s*\}'
-    match = re.search(key_re, key)
+    match = _KEY_RE.search(key)
 
     if not match: return key
 
@@ -11,7 +11,7 @@ setup(
     url='https://github.com/eddiedane/rake',
     packages=find_packages(),
     install_requires=[
-        'PyYAML',
+        'PyYAML',  # builds with LibYAML bindings where available, used for faster config parsing
         'pandas',
         'playwright',
         'colorama',
@@ -19,7 +19,8 @@ setup(
         'python-slugify',
         'click',
         'openpyxl',
-        'pypandoc'
+        'pypandoc',
+        'orjson'
     ],
     entry_points={
         'console_scripts': [